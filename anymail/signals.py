@@ -52,6 +52,35 @@ class AnymailTrackingEvent(AnymailEvent):
         self.tags = kwargs.pop("tags", [])  #: list of str
         self.user_agent = kwargs.pop("user_agent", None)  #: str
 
+    @classmethod
+    def _for_each(cls, per_event_kwargs, **common_kwargs):
+        """
+        Return a list of events, one for each dict in per_event_kwargs.
+
+        Like [cls(**common_kwargs, **kwargs) for kwargs in per_event_kwargs],
+        but runs __init__ only once (for webhooks that fan out a single ESP event
+        to many recipients). Differences from that:
+          - per_event_kwargs keys must be attributes __init__ would set, and not
+            already in common_kwargs (else TypeError, where __init__ would ignore
+            unknown keys)
+          - if common_kwargs doesn't provide them, the default metadata dict
+            and tags list are shared between all of the events
+        """
+        template = vars(cls(**common_kwargs))
+        allowed_keys = template.keys() - common_kwargs.keys()
+        events = []
+        for kwargs in per_event_kwargs:
+            if not kwargs.keys() <= allowed_keys:
+                raise TypeError(
+                    "%s._for_each() got unknown or duplicate per-event kwargs: %s"
+                    % (cls.__name__, ", ".join(sorted(kwargs.keys() - allowed_keys)))
+                )
+            event = cls.__new__(cls)
+            event.__dict__.update(template)
+            event.__dict__.update(kwargs)
+            events.append(event)
+        return events
+
 
 class AnymailInboundEvent(AnymailEvent):
     """Normalized inbound message event"""
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import io
 import json
+import re
+import threading
 import typing
 from base64 import b64decode
 
@@ -24,12 +27,13 @@ from ..signals import (
     inbound,
     tracking,
 )
-from ..utils import get_anymail_setting, getfirst
+from ..utils import UNSET, get_anymail_setting
 from .base import AnymailBaseWebhookView
 
 try:
     import boto3
-    from botocore.exceptions import ClientError
+    from botocore.client import Config
+    from botocore.exceptions import BotoCoreError, ClientError
 
     from ..backends.amazon_ses import _get_anymail_boto3_params
 except ImportError:
@@ -38,11 +42,155 @@ except ImportError:
     boto3 = _LazyError(
         AnymailImproperlyInstalled(missing_package="boto3", install_extra="amazon-ses")
     )
-    ClientError = object
+    BotoCoreError = ClientError = object
+    Config = type("Config", (object,), {})  # (never matches isinstance)
     _get_anymail_boto3_params = _LazyError(
         AnymailImproperlyInstalled(missing_package="boto3", install_extra="amazon-ses")
     )
 
+_VALID_SNS_TYPES = frozenset(
+    {"Notification", "SubscriptionConfirmation", "UnsubscribeConfirmation"}
+)
+
+# SES receipt spamVerdict status: AnymailInboundMessage.spam_detected
+_SPAM_VERDICT_MAP = {"PASS": False, "FAIL": True}
+
+# arn:partition:service:region:account-id:resource
+_ARN_REGION_RE = re.compile(r"^arn:[^:]*:[^:]*:([^:]*):")
+
+
+def _add_tag(header, props):
+    props["tags"].append(header["value"])
+
+
+def _set_metadata(header, props):
+    try:
+        props["metadata"] = json.loads(header["value"])
+    except (ValueError, TypeError, KeyError):
+        pass
+
+
+# Handlers for Anymail's custom X- headers (by lowercase header name)
+# that recover AnymailTrackingEvent props from SES mail headers
+_HEADER_HANDLERS = {
+    "x-tag": _add_tag,
+    "x-metadata": _set_metadata,
+}
+
+
+def _hashable_params(params):
+    """Return a hashable equivalent of boto3 params, for use as a cache key
+
+    Raises TypeError if params contains values that can't be hashed.
+    """
+    if isinstance(params, dict):
+        return tuple(sorted((key, _hashable_params(params[key])) for key in params))
+    elif isinstance(params, (list, tuple)):
+        return tuple(_hashable_params(value) for value in params)
+    elif isinstance(params, Config):
+        # (botocore Config doesn't implement equality; compare its option values)
+        return (
+            Config,
+            tuple(
+                (option, _hashable_params(getattr(params, option)))
+                for option in Config.OPTION_DEFAULTS
+            ),
+        )
+    else:
+        hash(params)  # raises TypeError if unhashable
+        return params
+
+
+# boto3 Sessions and clients are expensive to construct (they load botocore's
+# service data from disk), and Django creates a new view instance for every
+# request, so share them between requests. boto3 clients are thread safe,
+# but Sessions aren't, so serialize access to the caches.
+_BOTO_CACHE_MAXSIZE = 16
+_boto_sessions = {}  # _hashable_params(session_params) -> boto3 Session
+_boto_clients = {}  # (service_name, session key, client key) -> boto3 client
+_boto_cache_lock = threading.Lock()
+
+
+def _get_cached_boto_client(service_name, session_params, client_params):
+    try:
+        session_key = _hashable_params(session_params)
+        client_key = (service_name, session_key, _hashable_params(client_params))
+    except TypeError as err:
+        # Uncached clients would never be closed (callers don't close the client)
+        raise AnymailConfigurationError(
+            "Amazon SES webhooks can't use unhashable values in"
+            " AMAZON_SES_SESSION_PARAMS or AMAZON_SES_CLIENT_PARAMS: %s" % err
+        ) from err
+
+    with _boto_cache_lock:
+        try:
+            return _boto_clients[client_key]
+        except KeyError:
+            pass
+        try:
+            session = _boto_sessions[session_key]
+        except KeyError:
+            session = boto3.session.Session(**session_params)
+            _boto_sessions[session_key] = session
+            _evict_oldest(_boto_sessions)
+        client = session.client(service_name, **client_params)
+        _boto_clients[client_key] = client
+        _evict_oldest(_boto_clients)
+        return client
+
+
+def _evict_oldest(cache):
+    # (dicts preserve insertion order)
+    # Evicted clients aren't closed, as they may still be in use by another thread.
+    while len(cache) > _BOTO_CACHE_MAXSIZE:
+        del cache[next(iter(cache))]
+
+
+@atexit.register
+def _close_cached_boto_clients():
+    """Close and discard all boto3 clients (and Sessions) cached by the webhooks
+
+    For use only at exit and in tests (to avoid reusing mocked boto3 Sessions
+    and clients from earlier tests): it closes clients other threads may still
+    be using. (Changed settings don't require this: they use new cache keys.)
+    """
+    with _boto_cache_lock:
+        for client in _boto_clients.values():
+            client.close()
+        _boto_clients.clear()
+        _boto_sessions.clear()
+
+
+def _describe_content(content, max_length=256):
+    """Return a (possibly truncated) repr of str or bytes content for error messages"""
+    if isinstance(content, (str, bytes)) and len(content) > max_length:
+        return "%r... (%d %s total)" % (
+            content[:max_length],
+            len(content),
+            "bytes" if isinstance(content, bytes) else "chars",
+        )
+    return repr(content)
+
+
+class _SnsEnvelope:
+    """An Amazon SNS message, parsed once and cached on the request"""
+
+    __slots__ = ("data", "type", "message_id", "message_raw", "_inner")
+
+    def __init__(self, data):
+        self.data = data  # the complete SNS message dict
+        self.type = data.get("Type")
+        self.message_id = data.get("MessageId")
+        self.message_raw = data.get("Message")
+        self._inner = UNSET
+
+    @property
+    def inner(self):
+        """The SNS Message parsed as JSON (raises ValueError or TypeError if it isn't)"""
+        if self._inner is UNSET:
+            self._inner = json.loads(self.message_raw)
+        return self._inner
+
 
 class AmazonSESBaseWebhookView(AnymailBaseWebhookView):
     """Base view class for Amazon SES webhooks (SNS Notifications)"""
@@ -68,40 +216,45 @@ class AmazonSESBaseWebhookView(AnymailBaseWebhookView):
     @staticmethod
     def _parse_sns_message(request):
         # cache so we don't have to parse the json multiple times
-        if not hasattr(request, "_sns_message"):
+        if not hasattr(request, "_sns_envelope"):
             try:
                 body = request.body.decode(request.encoding or "utf-8")
-                request._sns_message = json.loads(body)
-            except (TypeError, ValueError, UnicodeDecodeError) as err:
+                request._sns_envelope = _SnsEnvelope(json.loads(body))
+            except (AttributeError, TypeError, ValueError) as err:
                 raise AnymailAPIError(
-                    "Malformed SNS message body %r" % request.body
+                    "Malformed SNS message body %s" % _describe_content(request.body)
                 ) from err
-        return request._sns_message
+        return request._sns_envelope
 
     def validate_request(self, request):
         # Block random posts that don't even have matching SNS headers
-        sns_message = self._parse_sns_message(request)
-        header_type = request.META.get("HTTP_X_AMZ_SNS_MESSAGE_TYPE", "<<missing>>")
-        body_type = sns_message.get("Type", "<<missing>>")
-        if header_type != body_type:
-            raise AnymailWebhookValidationFailure(
-                'SNS header "x-amz-sns-message-type: %s"'
-                ' doesn\'t match body "Type": "%s"' % (header_type, body_type)
-            )
-
-        if header_type not in [
-            "Notification",
-            "SubscriptionConfirmation",
-            "UnsubscribeConfirmation",
-        ]:
-            raise AnymailAPIError("Unknown SNS message type '%s'" % header_type)
+        envelope = self._parse_sns_message(request)
+        header_type, header_id = header_type_and_id = (
+            request.META.get("HTTP_X_AMZ_SNS_MESSAGE_TYPE"),
+            request.META.get("HTTP_X_AMZ_SNS_MESSAGE_ID"),
+        )
+        if header_type_and_id != (envelope.type, envelope.message_id):
+            # Figure out which doesn't match. (An unknown Type is reported below,
+            # in preference to a MessageId mismatch.)
+            if header_type != envelope.type:
+                raise AnymailWebhookValidationFailure(
+                    'SNS header "x-amz-sns-message-type: %s"'
+                    ' doesn\'t match body "Type": "%s"'
+                    % (header_type or "<<missing>>", envelope.type or "<<missing>>")
+                )
+            if header_type in _VALID_SNS_TYPES:
+                raise AnymailWebhookValidationFailure(
+                    'SNS header "x-amz-sns-message-id: %s"'
+                    ' doesn\'t match body "MessageId": "%s"'
+                    % (
+                        header_id or "<<missing>>",
+                        envelope.message_id or "<<missing>>",
+                    )
+                )
 
-        header_id = request.META.get("HTTP_X_AMZ_SNS_MESSAGE_ID", "<<missing>>")
-        body_id = sns_message.get("MessageId", "<<missing>>")
-        if header_id != body_id:
-            raise AnymailWebhookValidationFailure(
-                'SNS header "x-amz-sns-message-id: %s"'
-                ' doesn\'t match body "MessageId": "%s"' % (header_id, body_id)
+        if header_type not in _VALID_SNS_TYPES:
+            raise AnymailAPIError(
+                "Unknown SNS message type '%s'" % (header_type or "<<missing>>")
             )
 
         # Future: Verify SNS message signature
@@ -120,27 +273,26 @@ class AmazonSESBaseWebhookView(AnymailBaseWebhookView):
     def parse_events(self, request):
         # request *has* been validated by now
         events = []
-        sns_message = self._parse_sns_message(request)
-        sns_type = sns_message.get("Type")
-        if sns_type == "Notification":
-            message_string = sns_message.get("Message")
+        envelope = self._parse_sns_message(request)
+        if envelope.type == "Notification":
             try:
-                ses_event = json.loads(message_string)
+                ses_event = envelope.inner
             except (TypeError, ValueError) as err:
                 if (
                     "Successfully validated SNS topic for Amazon SES event publishing."
-                    == message_string
+                    == envelope.message_raw
                 ):
                     # this Notification is generated after SubscriptionConfirmation
                     pass
                 else:
                     raise AnymailAPIError(
-                        "Unparsable SNS Message %r" % message_string
+                        "Unparsable SNS Message %s"
+                        % _describe_content(envelope.message_raw)
                     ) from err
             else:
-                events = self.esp_to_anymail_events(ses_event, sns_message)
-        elif sns_type == "SubscriptionConfirmation":
-            self.auto_confirm_sns_subscription(sns_message)
+                events = self.esp_to_anymail_events(ses_event, envelope.data)
+        elif envelope.type == "SubscriptionConfirmation":
+            self.auto_confirm_sns_subscription(envelope.data)
         # else: just ignore other SNS messages (e.g., "UnsubscribeConfirmation")
         return events
 
@@ -152,15 +304,15 @@ class AmazonSESBaseWebhookView(AnymailBaseWebhookView):
         Return a boto3 client for service_name, using session_params and
         client_params from settings. Any kwargs are treated as additional
         client_params (overriding settings values).
+
+        Clients are cached and shared between requests (and threads),
+        so callers must not close the returned client.
         """
         if kwargs:
-            client_params = self.client_params.copy()
-            client_params.update(kwargs)
+            client_params = {**self.client_params, **kwargs}
         else:
             client_params = self.client_params
-        return boto3.session.Session(**self.session_params).client(
-            service_name, **client_params
-        )
+        return _get_cached_boto_client(service_name, self.session_params, client_params)
 
     def auto_confirm_sns_subscription(self, sns_message):
         """
@@ -198,27 +350,123 @@ class AmazonSESBaseWebhookView(AnymailBaseWebhookView):
 
         # Must confirm in TopicArn's own region
         # (which may be different from the default)
-        try:
-            (
-                _arn_tag,
-                _partition,
-                _service,
-                region,
-                _account,
-                _resource,
-            ) = topic_arn.split(":", maxsplit=6)
-        except (TypeError, ValueError):
+        match = _ARN_REGION_RE.match(topic_arn)
+        if match is None:
             raise ValueError(
                 "Invalid ARN format '{topic_arn!s}'".format(topic_arn=topic_arn)
             )
+        region = match.group(1)
 
         sns_client = self.get_boto_client("sns", region_name=region)
-        try:
-            sns_client.confirm_subscription(
-                TopicArn=topic_arn, Token=token, AuthenticateOnUnsubscribe="true"
-            )
-        finally:
-            sns_client.close()
+        sns_client.confirm_subscription(
+            TopicArn=topic_arn, Token=token, AuthenticateOnUnsubscribe="true"
+        )
+
+
+# Handlers for each SES event type. Each takes the event-type-specific
+# event_object (e.g., ses_event["bounce"]), and returns a dict of
+# AnymailTrackingEvent props for the event type, plus a list of per-recipient
+# props (or None to report the event for all of the message's recipients).
+
+
+def _handle_bounce(event_object):
+    event_props = dict(
+        event_type=EventType.BOUNCED,
+        description="{bounceType}: {bounceSubType}".format(**event_object),
+        reject_reason=RejectReason.BOUNCED,
+    )
+    per_recipient_props = [
+        dict(
+            recipient=recipient["emailAddress"],
+            mta_response=recipient.get("diagnosticCode"),
+        )
+        for recipient in event_object["bouncedRecipients"]
+    ]
+    return event_props, per_recipient_props
+
+
+def _handle_complaint(event_object):
+    event_props = dict(
+        event_type=EventType.COMPLAINED,
+        description=event_object.get("complaintFeedbackType"),
+        reject_reason=RejectReason.SPAM,
+        user_agent=event_object.get("userAgent"),
+    )
+    per_recipient_props = [
+        dict(recipient=recipient["emailAddress"])
+        for recipient in event_object["complainedRecipients"]
+    ]
+    return event_props, per_recipient_props
+
+
+def _handle_delivery(event_object):
+    event_props = dict(
+        event_type=EventType.DELIVERED,
+        mta_response=event_object.get("smtpResponse"),
+    )
+    per_recipient_props = [
+        dict(recipient=recipient) for recipient in event_object["recipients"]
+    ]
+    return event_props, per_recipient_props
+
+
+def _handle_send(event_object):
+    event_props = dict(
+        event_type=EventType.SENT,
+    )
+    return event_props, None
+
+
+def _handle_reject(event_object):
+    event_props = dict(
+        event_type=EventType.REJECTED,
+        description=event_object["reason"],
+        reject_reason=RejectReason.BLOCKED,
+    )
+    return event_props, None
+
+
+def _handle_open(event_object):
+    # SES doesn't report which recipient opened the message (it doesn't
+    # track them separately), so just report it for all_recipients
+    event_props = dict(
+        event_type=EventType.OPENED,
+        user_agent=event_object.get("userAgent"),
+    )
+    return event_props, None
+
+
+def _handle_click(event_object):
+    # SES doesn't report which recipient clicked the message (it doesn't
+    # track them separately), so just report it for all_recipients
+    event_props = dict(
+        event_type=EventType.CLICKED,
+        user_agent=event_object.get("userAgent"),
+        click_url=event_object.get("link"),
+    )
+    return event_props, None
+
+
+def _handle_rendering_failure(event_object):
+    event_props = dict(
+        event_type=EventType.FAILED,
+        description=event_object["errorMessage"],
+    )
+    return event_props, None
+
+
+# SES eventType: (handler, ses_event key for its event_object)
+_EVENT_HANDLERS = {
+    "Bounce": (_handle_bounce, "bounce"),
+    "Complaint": (_handle_complaint, "complaint"),
+    "Delivery": (_handle_delivery, "delivery"),
+    "Send": (_handle_send, "send"),
+    "Reject": (_handle_reject, "reject"),
+    "Open": (_handle_open, "open"),
+    "Click": (_handle_click, "click"),
+    # (this type doesn't follow usual event_object naming)
+    "Rendering Failure": (_handle_rendering_failure, "failure"),
+}
 
 
 class AmazonSESTrackingWebhookView(AmazonSESBaseWebhookView):
@@ -231,8 +479,10 @@ class AmazonSESTrackingWebhookView(AmazonSESBaseWebhookView):
         #   https://docs.aws.amazon.com/ses/latest/DeveloperGuide/event-publishing-retrieving-sns-contents.html
         #   https://docs.aws.amazon.com/ses/latest/DeveloperGuide/notification-contents.html
         # This code should handle either.
-        ses_event_type = getfirst(
-            ses_event, ["eventType", "notificationType"], "<<type missing>>"
+        ses_event_type = (
+            ses_event.get("eventType")
+            or ses_event.get("notificationType")
+            or "<<type missing>>"
         )
         if ses_event_type == "Received":
             # This is an inbound event
@@ -251,113 +501,47 @@ class AmazonSESTrackingWebhookView(AmazonSESBaseWebhookView):
         mail_object = ses_event.get("mail", {})
         # same as MessageId in SendRawEmail response:
         message_id = mail_object.get("messageId")
-        all_recipients = mail_object.get("destination", [])
 
         # Recover tags and metadata from custom headers
-        metadata = {}
-        tags = []
+        header_props = dict(metadata={}, tags=[])
         for header in mail_object.get("headers", []):
-            name = header["name"].lower()
-            if name == "x-tag":
-                tags.append(header["value"])
-            elif name == "x-metadata":
-                try:
-                    metadata = json.loads(header["value"])
-                except (ValueError, TypeError, KeyError):
-                    pass
-
-        # AnymailTrackingEvent props for all recipients:
-        common_props = dict(
-            esp_event=ses_event,
-            event_id=event_id,
-            message_id=message_id,
-            metadata=metadata,
-            tags=tags,
-            timestamp=timestamp,
-        )
-        # generate individual events for each of these:
-        per_recipient_props = [
-            dict(recipient=email_address) for email_address in all_recipients
-        ]
+            name = header["name"]
+            # (only X- headers are of interest; don't bother lowercasing the rest)
+            if name[:1] in ("x", "X"):
+                handler = _HEADER_HANDLERS.get(name.lower())
+                if handler is not None:
+                    handler(header, header_props)
 
         # event-type-specific data (e.g., ses_event["bounce"]):
-        event_object = ses_event.get(ses_event_type.lower(), {})
-
-        if ses_event_type == "Bounce":
-            common_props.update(
-                event_type=EventType.BOUNCED,
-                description="{bounceType}: {bounceSubType}".format(**event_object),
-                reject_reason=RejectReason.BOUNCED,
-            )
-            per_recipient_props = [
-                dict(
-                    recipient=recipient["emailAddress"],
-                    mta_response=recipient.get("diagnosticCode"),
-                )
-                for recipient in event_object["bouncedRecipients"]
-            ]
-        elif ses_event_type == "Complaint":
-            common_props.update(
-                event_type=EventType.COMPLAINED,
-                description=event_object.get("complaintFeedbackType"),
-                reject_reason=RejectReason.SPAM,
-                user_agent=event_object.get("userAgent"),
-            )
-            per_recipient_props = [
-                dict(recipient=recipient["emailAddress"])
-                for recipient in event_object["complainedRecipients"]
-            ]
-        elif ses_event_type == "Delivery":
-            common_props.update(
-                event_type=EventType.DELIVERED,
-                mta_response=event_object.get("smtpResponse"),
-            )
-            per_recipient_props = [
-                dict(recipient=recipient) for recipient in event_object["recipients"]
-            ]
-        elif ses_event_type == "Send":
-            common_props.update(
-                event_type=EventType.SENT,
-            )
-        elif ses_event_type == "Reject":
-            common_props.update(
-                event_type=EventType.REJECTED,
-                description=event_object["reason"],
-                reject_reason=RejectReason.BLOCKED,
-            )
-        elif ses_event_type == "Open":
-            # SES doesn't report which recipient opened the message (it doesn't
-            # track them separately), so just report it for all_recipients
-            common_props.update(
-                event_type=EventType.OPENED,
-                user_agent=event_object.get("userAgent"),
-            )
-        elif ses_event_type == "Click":
-            # SES doesn't report which recipient clicked the message (it doesn't
-            # track them separately), so just report it for all_recipients
-            common_props.update(
-                event_type=EventType.CLICKED,
-                user_agent=event_object.get("userAgent"),
-                click_url=event_object.get("link"),
-            )
-        elif ses_event_type == "Rendering Failure":
-            # (this type doesn't follow usual event_object naming)
-            event_object = ses_event["failure"]
-            common_props.update(
-                event_type=EventType.FAILED,
-                description=event_object["errorMessage"],
-            )
-        else:
+        try:
+            handler, event_object_key = _EVENT_HANDLERS[ses_event_type]
+        except KeyError:
             # Umm... new event type?
-            common_props.update(
+            event_props = dict(
                 event_type=EventType.UNKNOWN,
                 description="Unknown SES eventType '%s'" % ses_event_type,
             )
+            per_recipient_props = None
+        else:
+            event_props, per_recipient_props = handler(
+                ses_event.get(event_object_key, {})
+            )
+        if per_recipient_props is None:
+            # generate individual events for all recipients
+            per_recipient_props = [
+                dict(recipient=email_address)
+                for email_address in mail_object.get("destination", [])
+            ]
 
-        return [
-            AnymailTrackingEvent(**common_props, **recipient_props)
-            for recipient_props in per_recipient_props
-        ]
+        return AnymailTrackingEvent._for_each(
+            per_recipient_props,
+            esp_event=ses_event,
+            event_id=event_id,
+            message_id=message_id,
+            timestamp=timestamp,
+            **header_props,
+            **event_props,
+        )
 
 
 class AmazonSESInboundWebhookView(AmazonSESBaseWebhookView):
@@ -383,19 +567,24 @@ class AmazonSESInboundWebhookView(AmazonSESBaseWebhookView):
         if action_type == "SNS":
             content = ses_event.get("content")
             if action_object.get("encoding") == "BASE64":
-                content = b64decode(content.encode("ascii"))
-                message = AnymailInboundMessage.parse_raw_mime_bytes(content)
+                message = AnymailInboundMessage.parse_raw_mime_bytes(b64decode(content))
             else:
                 message = AnymailInboundMessage.parse_raw_mime(content)
         elif action_type == "S3":
             # Download message from s3 and parse. (SNS has 15s limit
             # for an http response; hope download doesn't take that long)
-            fp = self.download_s3_object(
-                bucket_name=action_object["bucketName"],
-                object_key=action_object["objectKey"],
-            )
+            bucket_name = action_object["bucketName"]
+            object_key = action_object["objectKey"]
+            fp = self.download_s3_object(bucket_name=bucket_name, object_key=object_key)
             try:
                 message = AnymailInboundMessage.parse_raw_mime_file(fp)
+            except BotoCoreError as err:
+                # Streaming the S3 object failed partway (e.g., read timeout).
+                # Unlike boto's download_fileobj, there's no retry here: instead
+                # the webhook fails, and SNS will redeliver the notification later.
+                raise AnymailAPIError(
+                    _s3_download_error_message(bucket_name, object_key)
+                ) from err
             finally:
                 fp.close()
         else:
@@ -417,7 +606,7 @@ class AmazonSESInboundWebhookView(AmazonSESBaseWebhookView):
             pass
         spam_status = receipt_object.get("spamVerdict", {}).get("status", "").upper()
         # spam_detected = False if no spam, True if spam, or None if unsure:
-        message.spam_detected = {"PASS": False, "FAIL": True}.get(spam_status)
+        message.spam_detected = _SPAM_VERDICT_MAP.get(spam_status)
 
         # "unique ID assigned to the email by Amazon SES":
         event_id = mail_object.get("messageId")
@@ -443,23 +632,37 @@ class AmazonSESInboundWebhookView(AmazonSESBaseWebhookView):
         (bytes or text) opened for reading. Caller is responsible for closing it.
         """
         s3_client = self.get_boto_client("s3")
-        bytesio = io.BytesIO()
         try:
-            s3_client.download_fileobj(bucket_name, object_key, bytesio)
+            response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
         except ClientError as err:
-            bytesio.close()
             # improve the botocore error message
             raise AnymailBotoClientAPIError(
-                "Anymail AmazonSESInboundWebhookView couldn't download"
-                " S3 object '{bucket_name}:{object_key}'"
-                "".format(bucket_name=bucket_name, object_key=object_key),
+                _s3_download_error_message(bucket_name, object_key),
                 client_error=err,
             ) from err
-        else:
-            bytesio.seek(0)
-            return bytesio
-        finally:
-            s3_client.close()
+
+        # Let the caller stream the content directly from the response body,
+        # rather than buffering a (possibly large) message in memory first.
+        body = response["Body"]
+        if not isinstance(body, io.IOBase):
+            # Older botocore StreamingBody isn't a complete file-like object
+            try:
+                return io.BytesIO(body.read())
+            except BotoCoreError as err:
+                raise AnymailAPIError(
+                    _s3_download_error_message(bucket_name, object_key)
+                ) from err
+            finally:
+                body.close()
+        return body
+
+
+def _s3_download_error_message(bucket_name, object_key):
+    return (
+        "Anymail AmazonSESInboundWebhookView couldn't download"
+        " S3 object '{bucket_name}:{object_key}'"
+        "".format(bucket_name=bucket_name, object_key=object_key)
+    )
 
 
 class AnymailBotoClientAPIError(AnymailAPIError, ClientError):
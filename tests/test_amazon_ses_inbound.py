@@ -0,0 +1,294 @@
+import json
+from base64 import b64encode
+from datetime import datetime, timezone
+from io import BytesIO
+from textwrap import dedent
+from unittest.mock import ANY
+
+from django.test import tag
+
+from anymail.exceptions import AnymailAPIError, AnymailConfigurationError
+from anymail.inbound import AnymailInboundMessage
+from anymail.signals import AnymailInboundEvent
+from anymail.webhooks.amazon_ses import AmazonSESInboundWebhookView
+
+from .test_amazon_ses_webhooks import AmazonSESWebhookTestsMixin, MockBotoSessionMixin
+from .webhook_cases import WebhookTestCase
+
+try:
+    from botocore.exceptions import ClientError, ReadTimeoutError
+except ImportError:
+    ClientError = ReadTimeoutError = None
+
+
+@tag("amazon_ses")
+class AmazonSESInboundTests(
+    AmazonSESWebhookTestsMixin, MockBotoSessionMixin, WebhookTestCase
+):
+    TEST_MIME_MESSAGE = dedent("""\
+        Return-Path: <bounce-handler@mail.example.org>
+        Received: from mail.example.org by inbound-smtp.us-east-1.amazonaws.com...
+        MIME-Version: 1.0
+        Received: by 10.1.1.1 with HTTP; Fri, 30 Mar 2018 10:21:49 -0700 (PDT)
+        From: "Sender, Inc." <from@example.org>
+        Date: Fri, 30 Mar 2018 10:21:50 -0700
+        Message-ID: <CAEPk3RKsi@mail.example.org>
+        Subject: Test inbound message
+        To: Recipient <inbound@example.com>, someone-else@example.org
+        Content-Type: multipart/alternative; boundary="94eb2c05e174adb140055b6339c5"
+
+        --94eb2c05e174adb140055b6339c5
+        Content-Type: text/plain; charset="UTF-8"
+        Content-Transfer-Encoding: quoted-printable
+
+        It's a body=E2=80=A6
+
+        --94eb2c05e174adb140055b6339c5
+        Content-Type: text/html; charset="UTF-8"
+        Content-Transfer-Encoding: quoted-printable
+
+        <div dir=3D"ltr">It's a body=E2=80=A6</div>
+
+        --94eb2c05e174adb140055b6339c5--
+        """).replace("\n", "\r\n")
+
+    def ses_inbound_event(self, action, **kwargs):
+        raw_ses_event = {
+            "notificationType": "Received",
+            "mail": {
+                "timestamp": "2018-03-30T17:21:51.636Z",
+                "source": "envelope-from@example.org",
+                "messageId": "jili9m351il3gkburn7o2f0u6788stij94c8ld01",
+                "destination": ["inbound@example.com", "someone-else@example.org"],
+            },
+            "receipt": {
+                "timestamp": "2018-03-30T17:21:51.636Z",
+                "recipients": ["inbound@example.com"],
+                "spamVerdict": {"status": "PASS"},
+                "action": action,
+            },
+        }
+        raw_ses_event.update(kwargs)
+        return raw_ses_event
+
+    def post_ses_event(self, raw_ses_event):
+        raw_sns_message = {
+            "Type": "Notification",
+            "MessageId": "8f6dde3b-2b0f-5a0b-8c68-d9ae8c7b4a6d",
+            "TopicArn": "arn:aws:sns:us-east-1:111111111111:SES_Inbound",
+            "Message": json.dumps(raw_ses_event),
+            "Timestamp": "2018-03-30T17:21:51.700Z",
+        }
+        return self.post_from_sns("/anymail/amazon_ses/inbound/", raw_sns_message)
+
+    def test_spam_verdict(self):
+        for status, spam_detected in [
+            ("PASS", False),
+            ("FAIL", True),
+            ("GRAY", None),
+            ("PROCESSING_FAILED", None),
+        ]:
+            with self.subTest(status):
+                self.inbound_handler.reset_mock()
+                raw_ses_event = self.ses_inbound_event(
+                    {"type": "SNS", "encoding": "UTF8"}, content=self.TEST_MIME_MESSAGE
+                )
+                raw_ses_event["receipt"]["spamVerdict"]["status"] = status
+                self.post_ses_event(raw_ses_event)
+                message = self.get_kwargs(self.inbound_handler)["event"].message
+                self.assertIs(message.spam_detected, spam_detected)
+
+    def test_missing_spam_verdict(self):
+        raw_ses_event = self.ses_inbound_event(
+            {"type": "SNS", "encoding": "UTF8"}, content=self.TEST_MIME_MESSAGE
+        )
+        del raw_ses_event["receipt"]["spamVerdict"]
+        self.post_ses_event(raw_ses_event)
+        message = self.get_kwargs(self.inbound_handler)["event"].message
+        self.assertIsNone(message.spam_detected)
+
+    S3_ACTION = {
+        "type": "S3",
+        "topicArn": "arn:aws:sns:us-east-1:111111111111:SES_Inbound",
+        "bucketName": "InboundEmailBucket-KeepPrivate",
+        "objectKeyPrefix": "inbound",
+        "objectKey": "inbound/fqef5sop459utgdf4o9lqbsv7jeo73pejig34301",
+    }
+
+    S3_ERROR_MESSAGE = (
+        "Anymail AmazonSESInboundWebhookView couldn't download S3 object"
+        " 'InboundEmailBucket-KeepPrivate:"
+        "inbound/fqef5sop459utgdf4o9lqbsv7jeo73pejig34301'"
+    )
+
+    def test_inbound_sns_utf8(self):
+        raw_ses_event = self.ses_inbound_event(
+            {"type": "SNS", "encoding": "UTF8"}, content=self.TEST_MIME_MESSAGE
+        )
+        response = self.post_ses_event(raw_ses_event)
+        self.assertEqual(response.status_code, 200)
+        message = self.get_kwargs(self.inbound_handler)["event"].message
+        self.assertEqual(message.envelope_sender, "envelope-from@example.org")
+        self.assertEqual(message.subject, "Test inbound message")
+        self.assertEqual(message.text, "It's a body\N{HORIZONTAL ELLIPSIS}\r\n")
+        self.assertEqual(
+            message.html,
+            """<div dir="ltr">It's a body\N{HORIZONTAL ELLIPSIS}</div>\r\n""",
+        )
+
+    def test_inbound_sns_missing_content(self):
+        raw_ses_event = self.ses_inbound_event({"type": "SNS", "encoding": "UTF8"})
+        response = self.post_ses_event(raw_ses_event)
+        self.assertEqual(response.status_code, 200)
+        message = self.get_kwargs(self.inbound_handler)["event"].message
+        self.assertIsInstance(message, AnymailInboundMessage)
+        self.assertIsNone(message.subject)
+        self.assertEqual(message.text, "")
+        self.assertEqual(message.envelope_sender, "envelope-from@example.org")
+
+    def test_inbound_sns_base64(self):
+        raw_ses_event = self.ses_inbound_event(
+            {"type": "SNS", "encoding": "BASE64"},
+            content=b64encode(self.TEST_MIME_MESSAGE.encode("ascii")).decode("ascii"),
+        )
+        response = self.post_ses_event(raw_ses_event)
+        self.assertEqual(response.status_code, 200)
+        message = self.get_kwargs(self.inbound_handler)["event"].message
+        self.assertEqual(message.envelope_sender, "envelope-from@example.org")
+        self.assertEqual(message.subject, "Test inbound message")
+        self.assertEqual(message.text, "It's a body\N{HORIZONTAL ELLIPSIS}\r\n")
+        # (no S3 download needed)
+        self.mock_session.assert_not_called()
+
+    def test_inbound_s3(self):
+        body = BytesIO(self.TEST_MIME_MESSAGE.encode("ascii"))
+        self.mock_client.get_object.return_value = {"Body": body}
+        raw_ses_event = self.ses_inbound_event(self.S3_ACTION)
+        response = self.post_ses_event(raw_ses_event)
+        self.assertEqual(response.status_code, 200)
+
+        self.mock_session.return_value.client.assert_called_once_with("s3", config=ANY)
+        self.mock_client.get_object.assert_called_once_with(
+            Bucket="InboundEmailBucket-KeepPrivate",
+            Key="inbound/fqef5sop459utgdf4o9lqbsv7jeo73pejig34301",
+        )
+        # the streamed body is closed after parsing,
+        # but the (cached) client isn't
+        self.assertTrue(body.closed)
+        self.mock_client.close.assert_not_called()
+
+        self.assert_handler_called_once_with(
+            self.inbound_handler,
+            sender=AmazonSESInboundWebhookView,
+            event=ANY,
+            esp_name="Amazon SES",
+        )
+        event = self.get_kwargs(self.inbound_handler)["event"]
+        self.assertIsInstance(event, AnymailInboundEvent)
+        self.assertEqual(event.event_type, "inbound")
+        self.assertEqual(
+            event.timestamp,
+            datetime(2018, 3, 30, 17, 21, 51, microsecond=636000, tzinfo=timezone.utc),
+        )
+        self.assertEqual(event.event_id, "jili9m351il3gkburn7o2f0u6788stij94c8ld01")
+        self.assertEqual(event.esp_event, raw_ses_event)
+
+        message = event.message
+        self.assertIsInstance(message, AnymailInboundMessage)
+        self.assertEqual(message.envelope_sender, "envelope-from@example.org")
+        self.assertEqual(message.envelope_recipient, "inbound@example.com")
+        self.assertEqual(str(message.from_email), '"Sender, Inc." <from@example.org>')
+        self.assertEqual(
+            [str(to) for to in message.to],
+            ["Recipient <inbound@example.com>", "someone-else@example.org"],
+        )
+        self.assertEqual(message.subject, "Test inbound message")
+        # (the email file parser normalizes line endings)
+        self.assertEqual(message.text, "It's a body\N{HORIZONTAL ELLIPSIS}\n")
+
+    def test_inbound_s3_legacy_streaming_body(self):
+        # Older botocore StreamingBody isn't an io.IOBase
+        class LegacyStreamingBody:
+            def __init__(self, content):
+                self._raw = BytesIO(content)
+
+            def read(self, amt=None):
+                return self._raw.read(amt)
+
+            def close(self):
+                self._raw.close()
+
+        body = LegacyStreamingBody(self.TEST_MIME_MESSAGE.encode("ascii"))
+        self.mock_client.get_object.return_value = {"Body": body}
+        response = self.post_ses_event(self.ses_inbound_event(self.S3_ACTION))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(body._raw.closed)
+        message = self.get_kwargs(self.inbound_handler)["event"].message
+        self.assertEqual(message.subject, "Test inbound message")
+
+    def test_inbound_s3_failure_message(self):
+        self.mock_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "403", "Message": "Forbidden"}},
+            operation_name="GetObject",
+        )
+        with self.assertRaisesMessage(AnymailAPIError, self.S3_ERROR_MESSAGE) as cm:
+            self.post_ses_event(self.ses_inbound_event(self.S3_ACTION))
+        # the raised error is also a boto ClientError:
+        self.assertIsInstance(cm.exception, ClientError)
+        self.assertIsInstance(cm.exception.__cause__, ClientError)
+        self.assertEqual(cm.exception.operation_name, "GetObject")
+        self.assertEqual(cm.exception.response["Error"]["Code"], "403")
+        self.assertEqual(cm.exception.args, (self.S3_ERROR_MESSAGE,))
+        self.assertIsNone(cm.exception.status_code)
+        self.inbound_handler.assert_not_called()
+
+    def test_inbound_s3_streaming_failure(self):
+        class FailingBody(BytesIO):
+            def read(self, *args, **kwargs):
+                raise ReadTimeoutError(endpoint_url="https://s3.example.com")
+
+        body = FailingBody()
+        self.mock_client.get_object.return_value = {"Body": body}
+        with self.assertRaisesMessage(AnymailAPIError, self.S3_ERROR_MESSAGE) as cm:
+            self.post_ses_event(self.ses_inbound_event(self.S3_ACTION))
+        # (the request succeeded, so this isn't a ClientError)
+        self.assertNotIsInstance(cm.exception, ClientError)
+        self.assertIsInstance(cm.exception.__cause__, ReadTimeoutError)
+        self.assertTrue(body.closed)
+        self.inbound_handler.assert_not_called()
+
+    def test_inbound_s3_legacy_streaming_body_failure(self):
+        class FailingLegacyStreamingBody:
+            closed = False
+
+            def read(self, amt=None):
+                raise ReadTimeoutError(endpoint_url="https://s3.example.com")
+
+            def close(self):
+                self.closed = True
+
+        body = FailingLegacyStreamingBody()
+        self.mock_client.get_object.return_value = {"Body": body}
+        with self.assertRaisesMessage(AnymailAPIError, self.S3_ERROR_MESSAGE) as cm:
+            self.post_ses_event(self.ses_inbound_event(self.S3_ACTION))
+        self.assertIsInstance(cm.exception.__cause__, ReadTimeoutError)
+        self.assertTrue(body.closed)
+
+    def test_unsupported_action_type(self):
+        raw_ses_event = self.ses_inbound_event({"type": "Lambda"})
+        with self.assertRaisesMessage(
+            AnymailConfigurationError,
+            "Anymail's Amazon SES inbound webhook works only with 'SNS' or 'S3'"
+            " receipt rule actions, not SNS notifications for Lambda actions.",
+        ):
+            self.post_ses_event(raw_ses_event)
+
+    def test_tracking_event_to_inbound_webhook(self):
+        with self.assertRaisesMessage(
+            AnymailConfigurationError,
+            "You seem to have set an Amazon SES *sending* event or notification"
+            " to publish to an SNS Topic that posts to Anymail's *inbound* webhook URL.",
+        ):
+            self.post_ses_event(
+                {"notificationType": "Delivery", "delivery": {}, "mail": {}}
+            )
@@ -0,0 +1,596 @@
+import json
+import math
+from datetime import datetime, timezone
+from unittest.mock import ANY, patch
+
+from django.test import ignore_warnings, override_settings, tag
+
+from anymail.exceptions import (
+    AnymailAPIError,
+    AnymailConfigurationError,
+    AnymailInsecureWebhookWarning,
+)
+from anymail.signals import AnymailTrackingEvent
+from anymail.webhooks import amazon_ses
+from anymail.webhooks.amazon_ses import (
+    AmazonSESTrackingWebhookView,
+    _close_cached_boto_clients,
+)
+
+from .webhook_cases import WebhookBasicAuthTestCase, WebhookTestCase
+
+
+class AmazonSESWebhookTestsMixin:
+    def post_from_sns(self, path, raw_sns_message, **kwargs):
+        # noinspection PyUnresolvedReferences
+        return self.client.post(
+            path,
+            content_type="text/plain; charset=UTF-8",  # SNS posts JSON as text/plain
+            data=json.dumps(raw_sns_message),
+            HTTP_X_AMZ_SNS_MESSAGE_ID=raw_sns_message["MessageId"],
+            HTTP_X_AMZ_SNS_MESSAGE_TYPE=raw_sns_message["Type"],
+            # Anymail doesn't use other x-amz-sns-* headers
+            **kwargs,
+        )
+
+
+class MockBotoSessionMixin:
+    """Patches boto3.session.Session, and clears the webhooks' boto client cache"""
+
+    def setUp(self):
+        super().setUp()
+        # Clear boto clients cached by earlier tests (before and after patching)
+        _close_cached_boto_clients()
+        self.addCleanup(_close_cached_boto_clients)
+        self.patch_boto3_session = patch(
+            "anymail.webhooks.amazon_ses.boto3.session.Session", autospec=True
+        )
+        self.mock_session = self.patch_boto3_session.start()
+        self.addCleanup(self.patch_boto3_session.stop)
+        self.mock_client = self.mock_session.return_value.client.return_value
+
+
+@tag("amazon_ses")
+class AmazonSESBotoClientCacheTests(
+    AmazonSESWebhookTestsMixin, MockBotoSessionMixin, WebhookTestCase
+):
+    def post_subscription_confirmation(self, region="us-west-2", message_id="1"):
+        return self.post_from_sns(
+            "/anymail/amazon_ses/tracking/",
+            {
+                "Type": "SubscriptionConfirmation",
+                "MessageId": message_id,
+                "Token": "EXAMPLE_TOKEN",
+                "TopicArn": "arn:aws:sns:%s:123456789012:SES_Tracking" % region,
+                "Message": "You have chosen to subscribe to the topic ...",
+            },
+        )
+
+    def test_reuses_client(self):
+        self.post_subscription_confirmation(message_id="1")
+        self.post_subscription_confirmation(message_id="2")
+        self.mock_session.assert_called_once_with()
+        self.mock_session.return_value.client.assert_called_once_with(
+            "sns", config=ANY, region_name="us-west-2"
+        )
+        self.assertEqual(self.mock_client.confirm_subscription.call_count, 2)
+        self.mock_client.close.assert_not_called()
+
+    def test_client_per_region(self):
+        self.post_subscription_confirmation(region="us-west-2")
+        self.post_subscription_confirmation(region="eu-west-1")
+        self.post_subscription_confirmation(region="us-west-2")
+        # one Session, shared between the clients
+        self.mock_session.assert_called_once_with()
+        client_calls = self.mock_session.return_value.client.call_args_list
+        self.assertEqual(len(client_calls), 2)
+        self.assertEqual(client_calls[0].kwargs["region_name"], "us-west-2")
+        self.assertEqual(client_calls[1].kwargs["region_name"], "eu-west-1")
+
+    def test_client_per_settings(self):
+        with override_settings(
+            ANYMAIL={
+                "WEBHOOK_SECRET": "username:password",
+                "AMAZON_SES_SESSION_PARAMS": {"profile_name": "anymail"},
+                "AMAZON_SES_CLIENT_PARAMS": {"config": {"read_timeout": 10}},
+            }
+        ):
+            self.post_subscription_confirmation(message_id="1")
+            self.post_subscription_confirmation(message_id="2")
+        with override_settings(
+            ANYMAIL={
+                "WEBHOOK_SECRET": "username:password",
+                "AMAZON_SES_SESSION_PARAMS": {"profile_name": "anymail"},
+                "AMAZON_SES_CLIENT_PARAMS": {"config": {"read_timeout": 20}},
+            }
+        ):
+            self.post_subscription_confirmation(message_id="3")
+        self.mock_session.assert_called_once_with(profile_name="anymail")
+        client_calls = self.mock_session.return_value.client.call_args_list
+        self.assertEqual(len(client_calls), 2)
+        self.assertEqual(client_calls[0].kwargs["config"].read_timeout, 10)
+        self.assertEqual(client_calls[1].kwargs["config"].read_timeout, 20)
+
+    def test_unhashable_params(self):
+        # Clients that can't be cached would never be closed
+        with override_settings(
+            ANYMAIL={
+                "WEBHOOK_SECRET": "username:password",
+                "AMAZON_SES_CLIENT_PARAMS": {"unhashable": {"a", "b"}},
+            }
+        ):
+            with self.assertRaisesMessage(
+                AnymailConfigurationError,
+                "Amazon SES webhooks can't use unhashable values in"
+                " AMAZON_SES_SESSION_PARAMS or AMAZON_SES_CLIENT_PARAMS",
+            ):
+                self.post_subscription_confirmation()
+        self.mock_session.assert_not_called()
+
+    def test_close_cached_boto_clients(self):
+        self.post_subscription_confirmation()
+        _close_cached_boto_clients()
+        self.mock_client.close.assert_called_once_with()
+        self.post_subscription_confirmation()
+        self.assertEqual(self.mock_session.call_count, 2)
+        self.assertEqual(self.mock_session.return_value.client.call_count, 2)
+
+
+@tag("amazon_ses")
+class AmazonSESNotificationsTests(AmazonSESWebhookTestsMixin, WebhookTestCase):
+    mail_object = {
+        "timestamp": "2018-03-26T17:58:59.000Z",
+        "source": "sender@example.com",
+        "messageId": "01000162639ad98a-0ff94aee-0b4e-4d37-98d1-7d6cafd1b3ea-000000",
+        "destination": ["recipient@example.com", "other@example.com"],
+        "headers": [
+            {"name": "Received", "value": "from mail.example.com ..."},
+            {"name": "DKIM-Signature", "value": "v=1; a=rsa-sha256; ..."},
+            {"name": "X-Tag", "value": "tag 1"},
+            {"name": "x-tag", "value": "tag 2"},
+            {"name": "X-Metadata", "value": '{"meta1":"string","meta2":2}'},
+        ],
+    }
+
+    def post_ses_event(self, raw_ses_event, timestamp="2018-03-26T17:58:59.675Z"):
+        raw_sns_message = {
+            "Type": "Notification",
+            "MessageId": "19ba9823-d7f2-53c1-860e-cb10e0d13dfc",
+            "TopicArn": "arn:aws:sns:us-east-1:111111111111:SES_Tracking",
+            "Message": json.dumps(raw_ses_event),
+            "Timestamp": timestamp,
+        }
+        response = self.post_from_sns("/anymail/amazon_ses/tracking/", raw_sns_message)
+        self.assertEqual(response.status_code, 200)
+        return [call.kwargs["event"] for call in self.tracking_handler.call_args_list]
+
+    def test_metadata_round_trip(self):
+        # X-Metadata is serialized by the backend with json.dumps,
+        # which allows values some other JSON parsers reject or alter
+        metadata_json = json.dumps(
+            {"order": 2**70 + 1, "score": float("nan"), "user": "bob"}
+        )
+        mail_object = dict(
+            self.mail_object,
+            headers=[{"name": "X-Metadata", "value": metadata_json}],
+        )
+        events = self.post_ses_event(
+            {"eventType": "Send", "send": {}, "mail": mail_object}
+        )
+        metadata = events[0].metadata
+        self.assertEqual(metadata["order"], 2**70 + 1)
+        self.assertTrue(math.isnan(metadata["score"]))
+        self.assertEqual(metadata["user"], "bob")
+
+    def test_esp_event_unaltered(self):
+        # The parsed SES event is provided to tracking handlers as-is
+        raw_ses_event = {
+            "eventType": "Send",
+            "send": {},
+            "mail": self.mail_object,
+            "large": 123456789012345678901234567890,
+        }
+        events = self.post_ses_event(raw_ses_event)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[0].esp_event, raw_ses_event)
+        self.assertEqual(events[0].esp_event["large"], 123456789012345678901234567890)
+
+    def test_tags_and_metadata_headers(self):
+        events = self.post_ses_event(
+            {"eventType": "Send", "send": {}, "mail": self.mail_object}
+        )
+        for event in events:
+            # header names are case-insensitive
+            self.assertEqual(event.tags, ["tag 1", "tag 2"])
+            self.assertEqual(event.metadata, {"meta1": "string", "meta2": 2})
+
+    def test_missing_or_invalid_headers(self):
+        cases = [
+            ("no headers", None),
+            ("other headers", [{"name": "X-Other", "value": "tag"}]),
+            ("invalid metadata", [{"name": "X-Metadata", "value": "not json"}]),
+            ("missing value", [{"name": "X-Metadata"}]),
+        ]
+        for description, headers in cases:
+            with self.subTest(description):
+                self.tracking_handler.reset_mock()
+                mail_object = dict(self.mail_object, headers=headers)
+                if headers is None:
+                    del mail_object["headers"]
+                events = self.post_ses_event(
+                    {"eventType": "Send", "send": {}, "mail": mail_object}
+                )
+                self.assertEqual(events[0].tags, [])
+                self.assertEqual(events[0].metadata, {})
+
+    def test_bounce_event(self):
+        events = self.post_ses_event(
+            {
+                "notificationType": "Bounce",
+                "bounce": {
+                    "bounceType": "Permanent",
+                    "bounceSubType": "General",
+                    "bouncedRecipients": [
+                        {
+                            "emailAddress": "recipient@example.com",
+                            "diagnosticCode": "smtp; 550 5.1.1 user unknown",
+                        },
+                        {"emailAddress": "other@example.com"},
+                    ],
+                },
+                "mail": self.mail_object,
+            }
+        )
+        self.assertEqual(len(events), 2)
+        event = events[0]
+        self.assertIsInstance(event, AnymailTrackingEvent)
+        self.assertEqual(event.event_type, "bounced")
+        self.assertEqual(event.esp_event["bounce"]["bounceType"], "Permanent")
+        self.assertEqual(event.event_id, "19ba9823-d7f2-53c1-860e-cb10e0d13dfc")
+        self.assertEqual(
+            event.timestamp,
+            datetime(2018, 3, 26, 17, 58, 59, microsecond=675000, tzinfo=timezone.utc),
+        )
+        self.assertEqual(event.message_id, self.mail_object["messageId"])
+        self.assertEqual(event.recipient, "recipient@example.com")
+        self.assertEqual(event.description, "Permanent: General")
+        self.assertEqual(event.reject_reason, "bounced")
+        self.assertEqual(event.mta_response, "smtp; 550 5.1.1 user unknown")
+        self.assertEqual(event.tags, ["tag 1", "tag 2"])
+        self.assertEqual(event.metadata, {"meta1": "string", "meta2": 2})
+        self.assertEqual(events[1].recipient, "other@example.com")
+        self.assertIsNone(events[1].mta_response)
+        self.assertEqual(events[1].description, "Permanent: General")
+
+        kwargs = self.get_kwargs(self.tracking_handler)
+        self.assertEqual(kwargs["sender"], AmazonSESTrackingWebhookView)
+        self.assertEqual(kwargs["esp_name"], "Amazon SES")
+
+    def test_complaint_event(self):
+        events = self.post_ses_event(
+            {
+                "eventType": "Complaint",
+                "complaint": {
+                    "complainedRecipients": [{"emailAddress": "recipient@example.com"}],
+                    "complaintFeedbackType": "abuse",
+                    "userAgent": "Mozilla/5.0 ...",
+                },
+                "mail": self.mail_object,
+            }
+        )
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        self.assertEqual(event.event_type, "complained")
+        self.assertEqual(event.recipient, "recipient@example.com")
+        self.assertEqual(event.description, "abuse")
+        self.assertEqual(event.reject_reason, "spam")
+        self.assertEqual(event.user_agent, "Mozilla/5.0 ...")
+
+    def test_delivery_event(self):
+        events = self.post_ses_event(
+            {
+                "eventType": "Delivery",
+                "delivery": {
+                    "recipients": ["recipient@example.com"],
+                    "smtpResponse": "250 2.6.0 Message received",
+                },
+                "mail": self.mail_object,
+            }
+        )
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        self.assertEqual(event.event_type, "delivered")
+        self.assertEqual(event.recipient, "recipient@example.com")
+        self.assertEqual(event.mta_response, "250 2.6.0 Message received")
+        self.assertEqual(event.tags, ["tag 1", "tag 2"])
+
+    def test_all_recipients_events(self):
+        cases = [
+            ("Send", {"send": {}}, "sent", {}),
+            (
+                "Reject",
+                {"reject": {"reason": "Bad content"}},
+                "rejected",
+                {"description": "Bad content", "reject_reason": "blocked"},
+            ),
+            (
+                "Open",
+                {"open": {"userAgent": "Mozilla/5.0 ..."}},
+                "opened",
+                {"user_agent": "Mozilla/5.0 ..."},
+            ),
+            (
+                "Click",
+                {"click": {"userAgent": "Mozilla/5.0 ...", "link": "https://x"}},
+                "clicked",
+                {"user_agent": "Mozilla/5.0 ...", "click_url": "https://x"},
+            ),
+            (
+                "Rendering Failure",
+                {"failure": {"errorMessage": "Missing var", "templateName": "t"}},
+                "failed",
+                {"description": "Missing var"},
+            ),
+            (
+                "DeliveryDelay",
+                {"deliveryDelay": {}},
+                "unknown",
+                {"description": "Unknown SES eventType 'DeliveryDelay'"},
+            ),
+        ]
+        for ses_event_type, event_data, event_type, expected_attrs in cases:
+            with self.subTest(ses_event_type):
+                self.tracking_handler.reset_mock()
+                events = self.post_ses_event(
+                    dict(eventType=ses_event_type, mail=self.mail_object, **event_data)
+                )
+                self.assertEqual(
+                    [event.recipient for event in events],
+                    ["recipient@example.com", "other@example.com"],
+                )
+                for event in events:
+                    self.assertEqual(event.event_type, event_type)
+                    self.assertEqual(event.tags, ["tag 1", "tag 2"])
+                    for attr, value in expected_attrs.items():
+                        self.assertEqual(getattr(event, attr), value)
+
+    def test_event_type_lookup(self):
+        # event publishing uses "eventType"; notifications use "notificationType"
+        for type_field in ["eventType", "notificationType"]:
+            with self.subTest(type_field):
+                self.tracking_handler.reset_mock()
+                events = self.post_ses_event(
+                    {type_field: "Send", "send": {}, "mail": self.mail_object}
+                )
+                self.assertEqual(events[0].event_type, "sent")
+
+    def test_missing_event_type(self):
+        events = self.post_ses_event({"mail": self.mail_object})
+        self.assertEqual(events[0].event_type, "unknown")
+        self.assertEqual(
+            events[0].description, "Unknown SES eventType '<<type missing>>'"
+        )
+
+    def test_invalid_timestamp(self):
+        events = self.post_ses_event(
+            {"eventType": "Send", "send": {}, "mail": self.mail_object},
+            timestamp="not a timestamp",
+        )
+        self.assertIsNone(events[0].timestamp)
+
+    def test_inbound_event_to_tracking_webhook(self):
+        with self.assertRaisesMessage(
+            AnymailConfigurationError,
+            "You seem to have set an Amazon SES *inbound* receipt rule to publish "
+            "to an SNS Topic that posts to Anymail's *tracking* webhook URL",
+        ):
+            self.post_ses_event(
+                {"notificationType": "Received", "mail": self.mail_object}
+            )
+
+
+@tag("amazon_ses")
+class AmazonSESWebhookSecurityTests(
+    AmazonSESWebhookTestsMixin, WebhookBasicAuthTestCase
+):
+    def call_webhook(self):
+        return self.post_from_sns(
+            "/anymail/amazon_ses/tracking/",
+            {"Type": "Notification", "MessageId": "123", "Message": "{}"},
+        )
+
+    # Most actual tests are in WebhookBasicAuthTestCase
+
+    def test_verifies_missing_auth(self):
+        # Must handle missing auth header slightly differently from other ESPs:
+        # SNS won't send auth unless it gets a 401 first
+        self.clear_basic_auth()
+        response = self.call_webhook()
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(
+            response["WWW-Authenticate"], 'Basic realm="Anymail WEBHOOK_SECRET"'
+        )
+
+
+@tag("amazon_ses")
+class AmazonSESNotificationValidationTests(AmazonSESWebhookTestsMixin, WebhookTestCase):
+    def post_with_sns_headers(self, raw_sns_message, message_type, message_id):
+        headers = {}
+        if message_type is not None:
+            headers["HTTP_X_AMZ_SNS_MESSAGE_TYPE"] = message_type
+        if message_id is not None:
+            headers["HTTP_X_AMZ_SNS_MESSAGE_ID"] = message_id
+        return self.client.post(
+            "/anymail/amazon_ses/tracking/",
+            content_type="text/plain; charset=UTF-8",
+            data=json.dumps(raw_sns_message),
+            **headers,
+        )
+
+    def test_type_mismatch(self):
+        raw_sns_message = {"Type": "Notification", "MessageId": "1", "Message": "{}"}
+        response = self.post_with_sns_headers(
+            raw_sns_message, "SubscriptionConfirmation", "1"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.tracking_handler.assert_not_called()
+
+    def test_message_id_mismatch(self):
+        raw_sns_message = {"Type": "Notification", "MessageId": "1", "Message": "{}"}
+        response = self.post_with_sns_headers(raw_sns_message, "Notification", "2")
+        self.assertEqual(response.status_code, 400)
+        self.tracking_handler.assert_not_called()
+
+    def test_missing_message_id(self):
+        raw_sns_message = {"Type": "Notification", "MessageId": "1", "Message": "{}"}
+        response = self.post_with_sns_headers(raw_sns_message, "Notification", None)
+        self.assertEqual(response.status_code, 400)
+        self.tracking_handler.assert_not_called()
+
+    def test_unknown_type_reported_before_message_id_mismatch(self):
+        with self.assertRaisesMessage(
+            AnymailAPIError, "Unknown SNS message type 'Unexpected'"
+        ):
+            self.post_with_sns_headers(
+                {"Type": "Unexpected", "MessageId": "1"}, "Unexpected", "2"
+            )
+
+    def test_missing_type(self):
+        with self.assertRaisesMessage(
+            AnymailAPIError, "Unknown SNS message type '<<missing>>'"
+        ):
+            self.post_with_sns_headers({"MessageId": "1"}, None, "1")
+
+    def test_malformed_body(self):
+        body = "{not json" + "x" * 1000
+        with self.assertRaisesMessage(
+            AnymailAPIError, "Malformed SNS message body b'{not json"
+        ) as cm:
+            self.client.post(
+                "/anymail/amazon_ses/tracking/",
+                content_type="text/plain; charset=UTF-8",
+                data=body,
+                HTTP_X_AMZ_SNS_MESSAGE_ID="1",
+                HTTP_X_AMZ_SNS_MESSAGE_TYPE="Notification",
+            )
+        # large content is truncated in the error message
+        self.assertIn("... (1009 bytes total)", str(cm.exception))
+        self.assertNotIn("x" * 300, str(cm.exception))
+
+    def test_unparsable_message(self):
+        message = "not json" + "x" * 1000
+        with self.assertRaisesMessage(
+            AnymailAPIError, "Unparsable SNS Message 'not json"
+        ) as cm:
+            self.post_from_sns(
+                "/anymail/amazon_ses/tracking/",
+                {"Type": "Notification", "MessageId": "1", "Message": message},
+            )
+        self.assertIn("... (1008 chars total)", str(cm.exception))
+
+    def test_parses_json_once(self):
+        raw_ses_event = {
+            "eventType": "Send",
+            "mail": {"destination": ["a@example.com"]},
+        }
+        raw_sns_message = {
+            "Type": "Notification",
+            "MessageId": "1",
+            "Message": json.dumps(raw_ses_event),
+        }
+        with patch.object(amazon_ses.json, "loads", wraps=json.loads) as mock_loads:
+            response = self.post_from_sns(
+                "/anymail/amazon_ses/tracking/", raw_sns_message
+            )
+        self.assertEqual(response.status_code, 200)
+        # once for the SNS envelope (shared by validation and parsing),
+        # and once for the SES event in its Message
+        self.assertEqual(mock_loads.call_count, 2)
+
+    def test_validated_sns_topic_notification(self):
+        raw_sns_message = {
+            "Type": "Notification",
+            "MessageId": "1",
+            "Message": "Successfully validated SNS topic for Amazon SES event publishing.",
+        }
+        response = self.post_from_sns("/anymail/amazon_ses/tracking/", raw_sns_message)
+        self.assertEqual(response.status_code, 200)
+        self.tracking_handler.assert_not_called()
+
+    def test_unsubscribe_confirmation_ignored(self):
+        raw_sns_message = {
+            "Type": "UnsubscribeConfirmation",
+            "MessageId": "1",
+            "Message": "You have chosen to deactivate subscription ...",
+        }
+        with patch.object(amazon_ses.json, "loads", wraps=json.loads) as mock_loads:
+            response = self.post_from_sns(
+                "/anymail/amazon_ses/tracking/", raw_sns_message
+            )
+        self.assertEqual(response.status_code, 200)
+        self.tracking_handler.assert_not_called()
+        # only the SNS envelope is parsed (its Message isn't JSON)
+        self.assertEqual(mock_loads.call_count, 1)
+
+
+@tag("amazon_ses")
+class AmazonSESSubscriptionManagementTests(
+    AmazonSESWebhookTestsMixin, MockBotoSessionMixin, WebhookTestCase
+):
+    # Anymail will automatically respond to SNS subscription notifications
+    # if Anymail is configured to require basic auth via WEBHOOK_SECRET.
+
+    SNS_SUBSCRIPTION_CONFIRMATION = {
+        "Type": "SubscriptionConfirmation",
+        "MessageId": "165545c9-2a5c-472c-8df2-7ff2be2b3b1b",
+        "Token": "EXAMPLE_TOKEN",
+        "TopicArn": "arn:aws:sns:us-west-2:123456789012:SES_Notifications",
+        "Message": "You have chosen to subscribe to the topic ...",
+        "SubscribeURL": "https://sns.us-west-2.amazonaws.com/?Action=...",
+        "Timestamp": "2012-04-26T20:45:04.751Z",
+    }
+
+    def test_sns_subscription_auto_confirmation(self):
+        """Anymail webhook will auto-confirm SNS topic subscriptions"""
+        response = self.post_from_sns(
+            "/anymail/amazon_ses/tracking/", self.SNS_SUBSCRIPTION_CONFIRMATION
+        )
+        self.assertEqual(response.status_code, 200)
+        # auto-confirmed in the topic's region:
+        self.mock_session.return_value.client.assert_called_once_with(
+            "sns", config=ANY, region_name="us-west-2"
+        )
+        self.mock_client.confirm_subscription.assert_called_once_with(
+            TopicArn="arn:aws:sns:us-west-2:123456789012:SES_Notifications",
+            Token="EXAMPLE_TOKEN",
+            AuthenticateOnUnsubscribe="true",
+        )
+        self.tracking_handler.assert_not_called()
+        self.inbound_handler.assert_not_called()
+
+    @override_settings(ANYMAIL={})  # clear WEBHOOK_SECRET setting from base class
+    @ignore_warnings(category=AnymailInsecureWebhookWarning)
+    def test_sns_subscription_confirmation_failure(self):
+        """Auto-confirmation notifies if webhook not configured with basic auth"""
+        self.clear_basic_auth()
+        with self.assertLogs("django.security.AnymailWebhookValidationFailure") as cm:
+            response = self.post_from_sns(
+                "/anymail/amazon_ses/tracking/", self.SNS_SUBSCRIPTION_CONFIRMATION
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(
+            "Anymail received an unexpected SubscriptionConfirmation request for"
+            " Amazon SNS topic 'arn:aws:sns:us-west-2:123456789012:SES_Notifications'",
+            cm.output[0],
+        )
+        self.assertIn("with token 'EXAMPLE_TOKEN'", cm.output[0])
+        self.mock_session.assert_not_called()
+        self.tracking_handler.assert_not_called()
+
+    def test_sns_subscription_invalid_topic_arn(self):
+        with self.assertRaisesMessage(ValueError, "Invalid ARN format 'not-an-arn'"):
+            self.post_from_sns(
+                "/anymail/amazon_ses/tracking/",
+                dict(self.SNS_SUBSCRIPTION_CONFIRMATION, TopicArn="not-an-arn"),
+            )
+        self.mock_client.confirm_subscription.assert_not_called()
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase
+
+from anymail.signals import AnymailTrackingEvent
+
+
+class AnymailTrackingEventForEachTests(SimpleTestCase):
+    # AnymailTrackingEvent._for_each is a private optimization
+    # for webhooks that fan out one ESP event to many recipients
+
+    common = dict(
+        event_type="delivered",
+        timestamp=datetime(2018, 3, 26, 17, 58, 59, tzinfo=timezone.utc),
+        event_id="event-id",
+        esp_event={"raw": "event"},
+        message_id="message-id",
+        tags=["tag"],
+        metadata={"meta": "data"},
+        description="shared description",
+    )
+
+    def test_matches_direct_construction(self):
+        per_event = [
+            dict(recipient="one@example.com", mta_response="250 OK"),
+            dict(recipient="two@example.com"),
+            dict(),
+        ]
+        events = AnymailTrackingEvent._for_each(per_event, **self.common)
+        expected = [
+            AnymailTrackingEvent(**self.common, **kwargs) for kwargs in per_event
+        ]
+        self.assertEqual(len(events), len(expected))
+        for event, expected_event in zip(events, expected):
+            self.assertIs(type(event), AnymailTrackingEvent)
+            self.assertEqual(vars(event), vars(expected_event))
+
+    def test_no_events(self):
+        self.assertEqual(AnymailTrackingEvent._for_each([], **self.common), [])
+
+    def test_duplicate_kwargs(self):
+        # (direct construction would also raise TypeError)
+        with self.assertRaisesMessage(
+            TypeError, "got unknown or duplicate per-event kwargs: description"
+        ):
+            AnymailTrackingEvent._for_each(
+                [dict(recipient="one@example.com", description="other")],
+                **self.common,
+            )
+
+    def test_unknown_kwargs(self):
+        # (stricter than direct construction, which ignores unknown kwargs)
+        with self.assertRaisesMessage(
+            TypeError, "got unknown or duplicate per-event kwargs: recipients"
+        ):
+            AnymailTrackingEvent._for_each(
+                [dict(recipients=["one@example.com"])], **self.common
+            )
+
+    def test_shared_defaults(self):
+        events = AnymailTrackingEvent._for_each(
+            [dict(recipient="one@example.com"), dict(recipient="two@example.com")],
+            event_type="delivered",
+        )
+        self.assertEqual(events[0].tags, [])
+        self.assertEqual(events[0].metadata, {})
+        self.assertIs(events[0].tags, events[1].tags)
+        self.assertIs(events[0].metadata, events[1].metadata)